@@ -26,13 +26,14 @@ model = pydantic.parse_obj_as(FormCell, {"input_type": "datetime", "value": "202
 model
 >>> Datetime(value=datetime.datetime(2021, 1, 1, 0, 0, tzinfo=datetime.timezone.utc))
 """
+import asyncio
 import enum
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Type, Union
 
 from IPython.core.interactiveshell import InteractiveShell
-from pydantic import Extra, Field, PrivateAttr, parse_obj_as, validator
+from pydantic import Extra, Field, PrivateAttr, validator
 from typing_extensions import Annotated
 
 from sidecar_comms.form_cells.observable import Change, ObservableModel
@@ -40,6 +41,10 @@ from sidecar_comms.handlers.variable_explorer import set_kernel_variable
 from sidecar_comms.outbound import SidecarComm, comm_manager
 
 FORM_CELL_CACHE: Dict[str, "FormCellBase"] = {}
+# after the first change, how long to wait before sending an update_form_cell message
+# with the latest state; changes in that window are sent together, so rapid updates
+# (e.g. dragging a slider) send at most one message per window
+SYNC_DEBOUNCE_SECONDS = 0.05
 
 
 class ExecutionTriggerBehavior(str, enum.Enum):
@@ -52,7 +57,7 @@ class FormCellBase(ObservableModel):
     """
     Base class for form cells.
      - registers the class instance to the FORM_CELL_CACHE
-     - makes sure comm is open between sidecar and kernel
+     - opens the comm between sidecar and kernel the first time a message is sent
      - when repr'd, override the ipython display handler and instead send a comm message so
        that the sidecar can handle `display_form_cell`
 
@@ -60,7 +65,8 @@ class FormCellBase(ObservableModel):
     models declared below.
     """
 
-    _comm: SidecarComm = PrivateAttr()
+    _comm: Optional[SidecarComm] = PrivateAttr(default=None)
+    _sync_handle: Optional[asyncio.TimerHandle] = PrivateAttr(default=None)
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     label: str = ""
     model_variable_name: str = ""
@@ -77,7 +83,6 @@ class FormCellBase(ObservableModel):
 
     def __init__(self, **data):
         super().__init__(**data)
-        self._comm = comm_manager().open_comm("form_cells")
         FORM_CELL_CACHE[self.id] = self
 
         self.observe(self._sync_sidecar)
@@ -94,11 +99,38 @@ class FormCellBase(ObservableModel):
         props = ", ".join(f"{k}={v!r}" for k, v in self.dict(exclude={"id"}).items())
         return f"<{self.__class__.__name__} {props}>"
 
+    def _get_comm(self) -> SidecarComm:
+        """Returns the form_cells comm, opening it on first use."""
+        if self._comm is None:
+            self._comm = comm_manager().open_comm("form_cells")
+        return self._comm
+
     def _sync_sidecar(self, change: Change):
-        """Send a comm_msg to the sidecar to update the form cell metadata."""
+        """Schedule a comm_msg to the sidecar to update the form cell metadata.
+
+        If there's a running event loop (i.e. inside the kernel), the first change
+        schedules a send SYNC_DEBOUNCE_SECONDS later, and any further changes before
+        then are included in that same message. The send isn't pushed back by later
+        changes, so continuous updates still send once per window.
+        Without a running event loop, the message is sent right away.
+        """
+        if self._sync_handle is not None:
+            # already scheduled; the flush will pick up this change too
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no event loop to schedule on, send right away
+            self._flush_sync()
+            return
+        self._sync_handle = loop.call_later(SYNC_DEBOUNCE_SECONDS, self._flush_sync)
+
+    def _flush_sync(self) -> None:
+        """Send a comm_msg to the sidecar with the latest form cell state."""
+        self._sync_handle = None
         # not sending `change` through because we're doing a full replace
         # based on the latest state of the model
-        self._comm.send(handler="update_form_cell", body=self.dict())
+        self._get_comm().send(handler="update_form_cell", body=self.dict())
 
     def _on_value_update(self, change: Change) -> None:
         """Update the kernel variable when the .value changes
@@ -108,7 +140,7 @@ class FormCellBase(ObservableModel):
 
     def _ipython_display_(self):
         """Send a message to the sidecar and print the form cell repr."""
-        self._comm.send(handler="display_form_cell", body=self.dict())
+        self._get_comm().send(handler="display_form_cell", body=self.dict())
         print(self.__repr__())
 
     def update(self, data: dict) -> None:
@@ -214,13 +246,21 @@ model_union = Union[
     Custom,
 ]
 FormCell = Annotated[model_union, Field(discriminator="input_type")]
-# we don't have any other way to check whether an `input_type` value is valid
-valid_model_input_types = [m.__fields__["input_type"].default for m in model_union.__args__]
+# `input_type` -> model class, built once at import instead of introspecting
+# the model fields every time a form cell is parsed
+FORM_CELL_MODELS: Dict[str, Type[FormCellBase]] = {
+    m.__fields__["input_type"].default: m for m in model_union.__args__
+}
+# no longer used internally (check `input_type in FORM_CELL_MODELS` instead);
+# kept for backwards compatibility since it's re-exported from `sidecar_comms`
+valid_model_input_types = list(FORM_CELL_MODELS)
 
 
 def parse_as_form_cell(data: dict) -> FormCell:
     # check if the input_type is valid before parsing into a model
     # in case we need to overwrite it as "custom"
-    if data["input_type"] not in valid_model_input_types:
+    if data["input_type"] not in FORM_CELL_MODELS:
         data["input_type"] = "custom"
-    return parse_obj_as(FormCell, data)
+    # instantiate the model directly rather than going through
+    # pydantic.parse_obj_as(FormCell, ...) since we already know the discriminator
+    return FORM_CELL_MODELS[data["input_type"]](**data)
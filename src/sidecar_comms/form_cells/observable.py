@@ -64,7 +64,10 @@ class ObservableModel(BaseModel):
             old_value = getattr(self, name)
             super().__setattr__(name, value)
             if old_value != value:
-                change = Change(name=name, old=old_value, new=value)
+                # the fields are already known-good (`name` is the field name and
+                # `value` was validated on assignment), so skip re-validating the
+                # Change on every update
+                change = Change.construct(name=name, old=old_value, new=value)
                 for obs in self._observers[name]:
                     obs.fn(change, *obs.args, **obs.kwargs)
 
@@ -1,25 +1,57 @@
+import itertools
 import json
 import sys
+from dataclasses import dataclass, field
 from typing import Any, Optional, Union
 
-from pydantic import BaseModel, Field
-
 from sidecar_comms.shell import get_ipython_shell
 
 MAX_STRING_LENGTH = 500
+# number of items to measure when estimating the size of large containers
+SIZE_SAMPLE_ITEMS = 32
 CONTAINER_TYPES = [list, set, frozenset, tuple]
+# prebuilt for isinstance() checks so we aren't converting the list on every call
+_CONTAINER_TYPES = tuple(CONTAINER_TYPES)
+# types that are always JSON serializable, so we don't need to json.dumps() them to check;
+# int isn't included since ints beyond sys.get_int_max_str_digits() can't be encoded
+_JSON_PRIMITIVE_TYPES = (str, float, bool, type(None))
+# built-in scalar types that don't need docstring/shape/extra property inspection
+_PRIMITIVE_TYPES = (str, int, float, bool, bytes, type(None))
+# private names and IPython's own user namespace entries aren't shown by default
+DEFAULT_SKIP_PREFIX = "_"
+DEFAULT_SKIP_NAMES = frozenset(
+    (
+        "In",
+        "Out",
+        "get_ipython",
+        "exit",
+        "quit",
+        "open",
+    )
+)
 
 
-class VariableModel(BaseModel):
+@dataclass
+class VariableModel:
+    # plain dataclass rather than a pydantic model since this is built for every
+    # variable on every poll; the helpers below are responsible for returning
+    # values of the right types
     name: str
     type: str
-    docstring: Optional[str]
-    module: Optional[str]
-    sample_value: Any  # may be the full value if small enough, only truncated for larger values
-    size: Optional[Union[int, tuple]]
-    size_bytes: Optional[int]
-    extra: dict = Field(default_factory=dict)
-    error: Optional[str]
+    docstring: Optional[str] = None
+    module: Optional[str] = None
+    # may be the full value if small enough, only truncated for larger values
+    sample_value: Any = None
+    size: Optional[Union[int, tuple]] = None
+    size_bytes: Optional[int] = None
+    extra: dict = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+class _CleanSample(list):
+    """Sampled container items that have already been checked as JSON serializable,
+    so `json_clean` doesn't need to walk them again.
+    """
 
 
 def variable_docstring(value: Any) -> Optional[str]:
@@ -36,20 +68,15 @@ def variable_type(value: Any) -> str:
 
 
 def variable_module(value: Any) -> str:
-    return getattr(value, "__module__", "")
+    module = getattr(value, "__module__", "")
+    return module if isinstance(module, str) else ""
 
 
 def variable_shape(value: Any) -> Optional[tuple]:
     """Returns the shape (n-dimensional; rows, columns, ...) of a variable."""
-    if (shape := getattr(value, "shape", None)) is None:
-        return
-    if not isinstance(shape, tuple):
-        return
-    if not shape:
-        return
-    if not isinstance(shape[0], int):
-        return
-    return shape
+    shape = getattr(value, "shape", None)
+    if isinstance(shape, tuple) and shape and isinstance(shape[0], int):
+        return shape
 
 
 def variable_size(value: Any) -> Optional[Union[int, tuple]]:
@@ -64,45 +91,101 @@ def variable_size(value: Any) -> Optional[Union[int, tuple]]:
     if hasattr(value, "__len__"):
         return len(value)
 
-    if (size := getattr(value, "size", None)) is None:
-        return
+    size = getattr(value, "size", None)
     if isinstance(size, int):
         return size
     if isinstance(size, tuple):
         return size[0]
 
 
+def sampled_container_size_bytes(value: Any, sample_size: int = SIZE_SAMPLE_ITEMS) -> int:
+    """Returns the approximate size of a container and its items in bytes.
+
+    Small containers are measured exactly; for larger ones, the average size of the
+    first `sample_size` items is extrapolated across the rest of the container.
+    """
+    container_bytes = sys.getsizeof(value)
+    n_items = len(value)
+    if n_items <= sample_size * 4:
+        return container_bytes + sum(sys.getsizeof(item) for item in value)
+
+    sample_bytes = sum(sys.getsizeof(item) for item in itertools.islice(value, sample_size))
+    return container_bytes + int(sample_bytes / sample_size * n_items)
+
+
 def variable_size_bytes(value: Any) -> Optional[int]:
-    """Returns the size of a variable in bytes."""
-    try:
-        return sys.getsizeof(value)
-    except Exception:
-        pass
-    # may be a pandas object
+    """Returns the size of a variable in bytes.
+
+    For pandas-like objects with `.memory_usage()`, this is the shallow memory usage,
+    which excludes the contents of object-dtype values (e.g. the strings themselves).
+    For lists, sets, frozensets, and tuples, this includes the size of the items,
+    estimated from a sample for large containers (see `sampled_container_size_bytes`).
+    """
+    # may be a pandas object; a shallow memory_usage() is per-column, whereas
+    # sys.getsizeof() on a pandas object does a deep walk of every value
     # TODO: add extra pandas object handlers
+    if callable(getattr(value, "memory_usage", None)):
+        try:
+            memory_usage = value.memory_usage(deep=False)
+            if hasattr(memory_usage, "sum"):
+                memory_usage = memory_usage.sum()
+            return int(memory_usage)
+        except Exception:
+            pass
+
     try:
-        return value.memory_usage().sum()
+        if isinstance(value, _CONTAINER_TYPES):
+            return sampled_container_size_bytes(value)
+        return sys.getsizeof(value)
     except Exception:
         pass
 
 
-def variable_sample_value(value: Any, max_length: Optional[int] = None) -> Any:
-    """Returns a short representation of a value."""
+def variable_sample_value(
+    value: Any,
+    max_length: Optional[int] = None,
+    size_bytes: Optional[int] = None,
+) -> Any:
+    """Returns a short representation of a value.
+
+    `size_bytes` may be passed in if `sys.getsizeof(value)` was already calculated
+    to avoid measuring the same object twice.
+    """
+    sample_value = _variable_sample_value(value, max_length=max_length, size_bytes=size_bytes)
+    # only mark the outermost sample as clean; nested samples keep their original
+    # container types so they can still be hashed into sampled sets/frozensets
+    if isinstance(sample_value, _CONTAINER_TYPES):
+        sample_value = _CleanSample(sample_value)
+    return sample_value
+
+
+def _variable_sample_value(
+    value: Any,
+    max_length: Optional[int] = None,
+    size_bytes: Optional[int] = None,
+) -> Any:
+    """Builds the sample value for `variable_sample_value`, recursing into containers."""
     sample_value = value
     max_length = max_length or MAX_STRING_LENGTH
 
-    if isinstance(value, tuple(CONTAINER_TYPES)):
+    if isinstance(value, _CONTAINER_TYPES):
         sample_items = [
-            variable_sample_value(item, max_length=max_length) for item in list(value)[:5]
+            _variable_sample_value(item, max_length=max_length) for item in list(value)[:5]
         ]
         container_type = type(value)
         # convert back to original type if we're only showing some items
         sample_value = container_type(sample_items)
+        # the precomputed size no longer applies to the sampled container
+        size_bytes = None
 
     if not is_json_serializable(sample_value):
         return
 
-    if variable_size_bytes(sample_value) > max_length:
+    # measure only the (sampled) object itself here, not the estimated size of its
+    # items that variable_size_bytes reports, so small samples aren't truncated
+    if size_bytes is None:
+        size_bytes = sys.getsizeof(sample_value)
+    if size_bytes > max_length:
         sample_value = repr(sample_value)[:max_length] + "..."
 
     return sample_value
@@ -114,10 +197,11 @@ def variable_extra_dtypes(value: Any, columns: list) -> dict:
     if dtypes is None:
         return {}
 
-    if variable_module(value).startswith("pandas") or isinstance(value.dtypes, dict):
-        dtypes = dict(value.dtypes).values()
-    else:
-        dtypes = list(value.dtypes)
+    # iterating a pandas Series of dtypes (or a list) yields the dtypes themselves,
+    # so we only need to special-case mappings; zip() below stops after `columns`
+    # instead of copying every dtype of a wide DataFrame
+    if isinstance(dtypes, dict):
+        dtypes = dtypes.values()
 
     # ensure we can still pass the string dtype through,
     # since they aren't JSON serializable
@@ -136,7 +220,8 @@ def variable_extra_list_property(value: Any, property_name: str, max_length: int
 
     elif not isinstance(prop, list):
         try:
-            prop = list(prop)
+            # only materialize the items we're returning
+            return list(itertools.islice(prop, max_length))
         except TypeError:
             # some non-iterable
             return []
@@ -149,36 +234,57 @@ def variable_extra_properties(value: Any) -> Optional[dict]:
     based on supported types.
     """
     extra = {}
+    value_type = variable_type(value)
 
-    if variable_type(value) == "DataFrame":
+    if value_type == "DataFrame":
         columns = variable_extra_list_property(value, "columns")
         extra["columns"] = columns
         extra["dtypes"] = variable_extra_dtypes(value, columns)
         extra["index"] = variable_extra_list_property(value, "index")
 
-    if variable_type(value) == "dict":
-        extra["keys"] = list(value.keys())[:100]
+    elif value_type == "dict":
+        extra["keys"] = list(itertools.islice(value.keys(), 100))
 
     return extra
 
 
+def primitive_variable_to_model(name: str, value: Any) -> VariableModel:
+    """Builds a VariableModel for a built-in scalar (int, str, None, etc.) without
+    probing for attributes that these types never have.
+    """
+    size_bytes = sys.getsizeof(value)
+    return VariableModel(
+        name=name,
+        type=variable_type(value),
+        # instances of built-in types don't have a __module__
+        module="",
+        sample_value=variable_sample_value(value, size_bytes=size_bytes),
+        size=len(value) if isinstance(value, (str, bytes)) else None,
+        size_bytes=size_bytes,
+    )
+
+
 def variable_to_model(name: str, value: Any) -> VariableModel:
     """Gathers properties of a variable to send to the sidecar through
     a variable explorer comm message.
     Should always have `name` and `type` properties; `error` will show
     conversion/inspection errors for size/size_bytes/sample_value.
     """
+    is_primitive = type(value) in _PRIMITIVE_TYPES
     basic_props = {
         "name": name,
         # "docstring": variable_docstring(value),
         "type": variable_type(value),
-        "module": variable_module(value),
+        # instances of built-in types don't have a __module__
+        "module": "" if is_primitive else variable_module(value),
     }
 
     # in the event we run into any parsing/validation errors,
     # we'll still send the variable model with basic properties
     # and an error message
     try:
+        if is_primitive:
+            return primitive_variable_to_model(name, value)
         return VariableModel(
             sample_value=variable_sample_value(value),
             size=variable_size(value),
@@ -194,6 +300,8 @@ def variable_to_model(name: str, value: Any) -> VariableModel:
 
 def is_json_serializable(value: Any) -> bool:
     """Returns True if a value is JSON serializable."""
+    if isinstance(value, _JSON_PRIMITIVE_TYPES):
+        return True
     try:
         json.dumps(value)
         return True
@@ -214,9 +322,15 @@ def json_clean(value: Any, max_length: Optional[int] = None) -> Optional[str]:
     """
     max_length = max_length or MAX_STRING_LENGTH
 
+    if isinstance(value, _JSON_PRIMITIVE_TYPES):
+        return value
+
+    if isinstance(value, _CleanSample):
+        return list(value)
+
     if isinstance(value, dict):
         value = {k: json_clean(v) for k, v in value.items()}
-    elif isinstance(value, tuple(CONTAINER_TYPES)):
+    elif isinstance(value, _CONTAINER_TYPES):
         container_type = type(value)
         value = container_type([json_clean(v) for v in value])
 
@@ -226,23 +340,31 @@ def json_clean(value: Any, max_length: Optional[int] = None) -> Optional[str]:
 
 def get_kernel_variables(skip_prefixes: list = None):
     """Returns a list of variables in the kernel."""
-    variables = dict(get_ipython_shell().user_ns)
+    user_ns = get_ipython_shell().user_ns
+    # filter before snapshotting the namespace instead of copying all of user_ns;
+    # still a snapshot since inspecting variables may run user code that changes it
+    if skip_prefixes:
+        skip_prefixes = tuple(skip_prefixes)
+        variables = [
+            (name, value) for name, value in user_ns.items() if not name.startswith(skip_prefixes)
+        ]
+    else:
+        variables = [
+            (name, value)
+            for name, value in user_ns.items()
+            if not (name.startswith(DEFAULT_SKIP_PREFIX) or name in DEFAULT_SKIP_NAMES)
+        ]
 
-    skip_prefixes = skip_prefixes or [
-        "_",
-        "In",
-        "Out",
-        "get_ipython",
-        "exit",
-        "quit",
-        "open",
-    ]
     variable_data = {}
-    for name, value in variables.items():
-        if name.startswith(tuple(skip_prefixes)):
-            continue
+    for name, value in variables:
         variable_model = variable_to_model(name=name, value=value)
-        cleaned_variable_model_dict = {k: json_clean(v) for k, v in variable_model.dict().items()}
+        # only sample_value and extra can hold user data; the other fields
+        # are always strings/numbers/None, so they don't need cleaning
+        cleaned_variable_model_dict = {
+            **variable_model.__dict__,
+            "sample_value": json_clean(variable_model.sample_value),
+            "extra": json_clean(variable_model.extra),
+        }
         variable_data[name] = cleaned_variable_model_dict
     return variable_data
 
@@ -1,6 +1,8 @@
+import asyncio
 from unittest.mock import Mock
 
 from sidecar_comms.form_cells.base import (
+    SYNC_DEBOUNCE_SECONDS,
     Checkboxes,
     Custom,
     Datetime,
@@ -157,6 +159,22 @@ class TestFormCellSetup:
         form_cell.value = "new value"
         assert get_ipython_shell().user_ns["test_value"] == "new value"
 
+    def test_comm_opened_on_first_send(self, mocker):
+        """Test that creating a form cell doesn't open a comm until
+        a message needs to be sent to the sidecar."""
+        mock_comm_manager = mocker.patch("sidecar_comms.form_cells.base.comm_manager")
+        data = {
+            "input_type": "text",
+            "model_variable_name": "test",
+            "value_variable_name": "test_value",
+            "value": "test",
+        }
+        form_cell = parse_as_form_cell(data)
+        mock_comm_manager.assert_not_called()
+
+        form_cell.value = "new value"
+        mock_comm_manager.return_value.open_comm.assert_called_once_with("form_cells")
+
 
 class TestFormCellUpdates:
     def test_update_dict_settings(self):
@@ -239,3 +257,45 @@ class TestFormCellObservers:
                 "new": ["a", "b", "x", "y"],
             }
         )
+
+    def test_sync_sidecar_debounced(self, mocker):
+        """Test that rapid changes to a form cell inside a running event loop
+        are sent to the sidecar as a single update with the latest state."""
+        mock_comm_manager = mocker.patch("sidecar_comms.form_cells.base.comm_manager")
+        mock_send = mock_comm_manager.return_value.open_comm.return_value.send
+        data = {
+            "input_type": "slider",
+            "model_variable_name": "test",
+            "value_variable_name": "test_value",
+            "value": 0,
+        }
+        form_cell = parse_as_form_cell(data)
+
+        async def drag_slider():
+            for value in range(1, 6):
+                form_cell.value = value
+            await asyncio.sleep(SYNC_DEBOUNCE_SECONDS * 2)
+
+        asyncio.run(drag_slider())
+        mock_send.assert_called_once()
+        assert mock_send.call_args.kwargs["body"]["value"] == 5
+
+    def test_sync_sidecar_without_event_loop(self, mocker):
+        """Test that form cell changes are sent to the sidecar right away
+        when there's no running event loop."""
+        mock_comm_manager = mocker.patch("sidecar_comms.form_cells.base.comm_manager")
+        mock_send = mock_comm_manager.return_value.open_comm.return_value.send
+        data = {
+            "input_type": "slider",
+            "model_variable_name": "test",
+            "value_variable_name": "test_value",
+            "value": 0,
+        }
+        form_cell = parse_as_form_cell(data)
+
+        form_cell.value = 1
+        assert mock_send.call_count == 1
+        assert mock_send.call_args.kwargs["body"]["value"] == 1
+        form_cell.value = 2
+        assert mock_send.call_count == 2
+        assert mock_send.call_args.kwargs["body"]["value"] == 2
@@ -1,9 +1,16 @@
+import json
+import sys
+
 import modin.pandas as mpd
 import pandas as pd
 import polars as pl
 import pytest
 
-from sidecar_comms.handlers.variable_explorer import get_kernel_variables, variable_sample_value
+from sidecar_comms.handlers.variable_explorer import (
+    SIZE_SAMPLE_ITEMS,
+    get_kernel_variables,
+    variable_sample_value,
+)
 from sidecar_comms.shell import get_ipython_shell
 
 
@@ -23,6 +30,20 @@ class TestGetKernelVariables:
         assert "_baz" not in variables
         assert "SECRET_abc" not in variables
 
+    def test_default_skipped_names(self):
+        """Test that private names and IPython's own namespace entries are skipped
+        by default, without hiding user variables that only share a prefix with them."""
+        shell = get_ipython_shell()
+        shell.user_ns["_private"] = 123
+        shell.user_ns["open_orders"] = 5
+        shell.user_ns["Index_map"] = {}
+        variables = get_kernel_variables()
+        assert "_private" not in variables
+        assert "In" in shell.user_ns
+        assert "In" not in variables
+        assert "open_orders" in variables
+        assert "Index_map" in variables
+
     def test_integer(self):
         """Test that a basic integer variable is added to the variables
         response with the correct information."""
@@ -63,6 +84,90 @@ class TestGetKernelVariables:
         assert variables[variable_name]["size"] == 4
         assert variables[variable_name]["sample_value"] == variable_value
 
+    def test_long_list(self):
+        """Test that a long list variable is added to the variables
+        response with only the first few items as the sample value."""
+        variable_name = "long_list"
+        variable_value = list(range(10_000))
+        get_ipython_shell().user_ns[variable_name] = variable_value
+        variables = get_kernel_variables()
+        assert variable_name in variables
+        assert variables[variable_name]["type"] == "list"
+        assert variables[variable_name]["size"] == len(variable_value)
+        assert variables[variable_name]["sample_value"] == [0, 1, 2, 3, 4]
+        assert type(variables[variable_name]["sample_value"]) is list
+        # includes the (estimated) size of the items, not just the list itself
+        assert variables[variable_name]["size_bytes"] > sys.getsizeof(variable_value)
+
+    def test_list_of_medium_strings(self):
+        """Test that a list of medium-length strings is sampled as a list of
+        its first few items rather than a truncated string repr."""
+        variable_name = "medium_strings"
+        variable_value = ["x" * 100 for _ in range(10)]
+        get_ipython_shell().user_ns[variable_name] = variable_value
+        variables = get_kernel_variables()
+        assert variables[variable_name]["sample_value"] == variable_value[:5]
+        assert variables[variable_name]["size_bytes"] > sys.getsizeof(variable_value)
+
+    def test_list_of_huge_integers(self):
+        """Test that a list containing an integer too large to convert to a string
+        is still sampled without errors."""
+        variable_name = "huge_int_list"
+        variable_value = [10**5000]
+        get_ipython_shell().user_ns[variable_name] = variable_value
+        variables = get_kernel_variables()
+        assert variables[variable_name]["error"] is None
+        assert variables[variable_name]["size"] == 1
+
+    def test_set_of_tuples(self):
+        """Test that a set containing tuples is added to the variables
+        response without errors."""
+        variable_name = "set_of_tuples"
+        variable_value = {(1, 2), (3, 4)}
+        get_ipython_shell().user_ns[variable_name] = variable_value
+        variables = get_kernel_variables()
+        assert variable_name in variables
+        assert variables[variable_name]["type"] == "set"
+        assert variables[variable_name]["error"] is None
+        assert variables[variable_name]["size"] == 2
+        assert variables[variable_name]["size_bytes"] is not None
+
+    def test_list_of_tuples(self):
+        """Test that nested tuples in a list are still sampled as JSON arrays."""
+        variable_name = "list_of_tuples"
+        variable_value = [(1, 2), (3, 4)]
+        get_ipython_shell().user_ns[variable_name] = variable_value
+        variables = get_kernel_variables()
+        assert variables[variable_name]["error"] is None
+        assert json.loads(json.dumps(variables[variable_name]["sample_value"])) == [
+            [1, 2],
+            [3, 4],
+        ]
+
+    def test_huge_integer(self):
+        """Test that an integer too large to convert to a string is added to the
+        variables response without a sample value."""
+        variable_name = "huge_int"
+        variable_value = 10**5000
+        get_ipython_shell().user_ns[variable_name] = variable_value
+        variables = get_kernel_variables()
+        assert variables[variable_name]["type"] == "int"
+        assert variables[variable_name]["error"] is None
+        assert variables[variable_name]["size_bytes"] == sys.getsizeof(variable_value)
+
+    def test_broken_primitive(self, mocker):
+        """Test that an inspection error on a built-in scalar populates `error`
+        instead of failing the whole variables response."""
+        mocker.patch(
+            "sidecar_comms.handlers.variable_explorer.variable_sample_value",
+            side_effect=ValueError("can't sample"),
+        )
+        variable_name = "broken_int"
+        get_ipython_shell().user_ns[variable_name] = 123
+        variables = get_kernel_variables()
+        assert variables[variable_name]["type"] == "int"
+        assert variables[variable_name]["error"] == repr(ValueError("can't sample"))
+
     def test_long_string(self):
         """Test that a long string variable is added to the variables
         response with the correct information."""
@@ -173,3 +278,69 @@ class TestDataFrameVariables:
             assert isinstance(variables[variable_name]["extra"]["dtypes"], dict)
             assert "a" in variables[variable_name]["extra"]["columns"]
             assert "a" in variables[variable_name]["extra"]["dtypes"]
+
+    def test_dataframe_size_bytes_shallow(self):
+        """Test that pandas objects report their shallow memory usage, which
+        excludes the contents of object-dtype values."""
+        df = pd.DataFrame({"a": ["x" * 1000] * 100})
+        get_ipython_shell().user_ns.update({"object_df": df, "object_series": df["a"]})
+
+        variables = get_kernel_variables()
+        df_size_bytes = variables["object_df"]["size_bytes"]
+        assert df_size_bytes == df.memory_usage(deep=False).sum()
+        assert df_size_bytes < df.memory_usage(deep=True).sum()
+        series_size_bytes = variables["object_series"]["size_bytes"]
+        assert series_size_bytes == df["a"].memory_usage(deep=False)
+
+
+class TestVariableSizeBytes:
+    def test_small_container_exact(self):
+        """Test that small containers report the size of the container plus
+        each of its items."""
+        variable_name = "small_container"
+        variable_value = ["x" * i for i in range(SIZE_SAMPLE_ITEMS * 4)]
+        get_ipython_shell().user_ns[variable_name] = variable_value
+        variables = get_kernel_variables()
+        expected = sys.getsizeof(variable_value) + sum(sys.getsizeof(v) for v in variable_value)
+        assert variables[variable_name]["size_bytes"] == expected
+
+    def test_large_container_extrapolated(self):
+        """Test that containers with more than 4 * SIZE_SAMPLE_ITEMS items
+        extrapolate the item sizes from the first SIZE_SAMPLE_ITEMS items."""
+        variable_name = "large_container"
+        n_items = SIZE_SAMPLE_ITEMS * 4 + 1
+        variable_value = ["x"] * SIZE_SAMPLE_ITEMS + ["x" * 1000] * (n_items - SIZE_SAMPLE_ITEMS)
+        get_ipython_shell().user_ns[variable_name] = variable_value
+        variables = get_kernel_variables()
+        expected = sys.getsizeof(variable_value) + sys.getsizeof("x") * n_items
+        assert variables[variable_name]["size_bytes"] == expected
+
+
+class TestVariableUpdates:
+    def test_list_item_changed(self):
+        """Test that changing a list item in place between polls is reflected
+        in the next variables response."""
+        variable_name = "mutated_list"
+        variable_value = [1, 2, 3]
+        get_ipython_shell().user_ns[variable_name] = variable_value
+        variables = get_kernel_variables()
+        assert variables[variable_name]["sample_value"] == [1, 2, 3]
+
+        variable_value[0] = 99
+        variables = get_kernel_variables()
+        assert variables[variable_name]["sample_value"] == [99, 2, 3]
+
+    def test_dataframe_columns_changed(self):
+        """Test that renaming DataFrame columns and changing their dtypes in place
+        between polls is reflected in the next variables response."""
+        variable_name = "mutated_df"
+        df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+        get_ipython_shell().user_ns[variable_name] = df
+        variables = get_kernel_variables()
+        assert variables[variable_name]["extra"]["columns"] == ["a", "b"]
+
+        df.columns = ["p", "q"]
+        df["p"] = df["p"].astype(str)
+        variables = get_kernel_variables()
+        assert variables[variable_name]["extra"]["columns"] == ["p", "q"]
+        assert variables[variable_name]["extra"]["dtypes"] == {"p": "object", "q": "int64"}